@@ -1,10 +1,12 @@
 """Discord bot for the Solana Wallet Tracker."""
 
 import asyncio
+import functools
 import logging
 import os
 import re
 import sys
+import time
 from pathlib import Path
 
 import discord
@@ -24,6 +26,11 @@ logger = logging.getLogger("wallet_tracker_bot")
 MINT_RE = re.compile(r"^[1-9A-HJ-NP-Za-km-z]{32,44}$")
 
 
+def _is_mint(value: str) -> bool:
+    """Check for a mint address; the length gate skips the regex for tickers."""
+    return 32 <= len(value) <= 44 and MINT_RE.match(value) is not None
+
+
 # ---------------------------------------------------------------------------
 # Embed builders
 # ---------------------------------------------------------------------------
@@ -73,12 +80,12 @@ def build_search_embed(result: SearchResult) -> discord.Embed:
             value=f"```\n{wallet.address}\n```",
             inline=False,
         )
-        amt = list(wallet.holdings.values())[0] if wallet.holdings else 0
+        amt = next(iter(wallet.holdings.values())) if wallet.holdings else 0
         embed.add_field(name="Balance", value=f"`{amt:,.6f}`", inline=True)
     elif result.found:
         lines = []
         for i, m in enumerate(result.candidates[:10], 1):
-            amt = list(m.holdings.values())[0] if m.holdings else 0
+            amt = next(iter(m.holdings.values())) if m.holdings else 0
             lines.append(f"{i}. {m.address}  ({amt:,.2f})")
         wallet_list = "\n".join(lines)
         if len(result.candidates) > 10:
@@ -137,7 +144,7 @@ def build_verification_embed(result: VerificationResult) -> discord.Embed:
     )
     embed.add_field(
         name="Verification",
-        value=f"`{result.verification_query.ticker}` — {result.verification_query.token_amount:,.6f} tokens ({len(result.verification_candidates)} candidates)",
+        value=f"`{result.verification_query.ticker}` — {result.verification_query.token_amount:,.6f} tokens ({len(result.verification_candidates)} of the primary candidates)",
         inline=True,
     )
 
@@ -148,6 +155,11 @@ def build_verification_embed(result: VerificationResult) -> discord.Embed:
 # Token disambiguation view (Select dropdown)
 # ---------------------------------------------------------------------------
 
+def _fmt_usd(value: float) -> str:
+    """Format a USD amount for display, or N/A when missing."""
+    return f"${value:,.0f}" if value else "N/A"
+
+
 class TokenSelectView(discord.ui.View):
     """Dropdown for selecting from multiple token matches."""
 
@@ -155,27 +167,29 @@ class TokenSelectView(discord.ui.View):
         self,
         candidates: list[TokenInfo],
         amount: float,
-        config: Config,
+        matcher: WalletMatcher,
         *,
         original_interaction: discord.Interaction,
     ):
         super().__init__(timeout=60.0)
         self.amount = amount
-        self.config = config
+        self.matcher = matcher
         self.candidates = candidates
         self.original_interaction = original_interaction
 
-        options = []
-        for i, token in enumerate(candidates[:25]):
-            mcap = f"MCap: ${token.market_cap:,.0f}" if token.market_cap else "MCap: N/A"
-            liq = f"Liq: ${token.liquidity_usd:,.0f}" if token.liquidity_usd else "Liq: N/A"
-            options.append(
-                discord.SelectOption(
-                    label=f"{token.symbol} — {token.name[:45]}",
-                    description=f"{mcap} | {liq} | {token.mint_address[:24]}...",
-                    value=str(i),
-                )
+        # Discord rejects labels/descriptions over 100 chars, so cap them here
+        options = [
+            discord.SelectOption(
+                label=f"{token.symbol} — {token.name}"[:100],
+                description=(
+                    f"MCap: {_fmt_usd(token.market_cap)} | "
+                    f"Liq: {_fmt_usd(token.liquidity_usd)} | "
+                    f"{token.mint_address[:24]}..."
+                )[:100],
+                value=str(i),
             )
+            for i, token in enumerate(candidates[:25])
+        ]
 
         select = discord.ui.Select(
             placeholder="Select the correct token...",
@@ -196,11 +210,7 @@ class TokenSelectView(discord.ui.View):
             mint_address=selected.mint_address,
         )
 
-        matcher = WalletMatcher(self.config)
-        try:
-            result = await asyncio.to_thread(matcher.find_candidates, query)
-        finally:
-            matcher.close()
+        result = await self.matcher.find_candidates(query)
 
         embed = build_search_embed(result)
         await interaction.followup.send(embed=embed)
@@ -227,6 +237,10 @@ class WalletTrackerBot(discord.Client):
         self.tree = app_commands.CommandTree(self)
         self.config = Config.load()
 
+        # Long-lived clients shared by all commands (keeps connection pools warm)
+        self.matcher = WalletMatcher(self.config)
+        self.resolver: TokenResolver = self.matcher.resolver
+
     async def setup_hook(self):
         guild_id = os.getenv("DISCORD_GUILD_ID")
         if guild_id:
@@ -241,6 +255,10 @@ class WalletTrackerBot(discord.Client):
     async def on_ready(self):
         logger.info("Logged in as %s (ID: %s)", self.user, self.user.id)
 
+    async def close(self):
+        await self.matcher.close()
+        await super().close()
+
 
 bot = WalletTrackerBot()
 
@@ -252,18 +270,14 @@ bot = WalletTrackerBot()
 async def _resolve_query(token: str, amount: float) -> HoldingQuery | None:
     """Resolve a token string to a HoldingQuery. Auto-picks highest liquidity."""
     token = token.strip()
-    if MINT_RE.match(token):
+    if _is_mint(token):
         return HoldingQuery(
             ticker=token[:8] + "...",
             token_amount=amount,
             mint_address=token,
         )
 
-    resolver = TokenResolver()
-    try:
-        candidates = await asyncio.to_thread(resolver.search_by_ticker, token.upper())
-    finally:
-        resolver.close()
+    candidates = await bot.resolver.search_by_ticker(token.upper())
 
     if not candidates:
         return None
@@ -276,6 +290,43 @@ async def _resolve_query(token: str, amount: float) -> HoldingQuery | None:
     )
 
 
+# ---------------------------------------------------------------------------
+# Helper: acknowledge interactions before any network work
+# ---------------------------------------------------------------------------
+
+def with_defer(func):
+    """
+    Wrap a slash command so it is deferred before anything else runs.
+
+    Discord requires an acknowledgement within 3 seconds, so the wrapper
+    calls ``defer(thinking=True)`` first, then runs the command body. All
+    replies from the body must therefore go through ``interaction.followup``.
+    Unhandled errors are logged and reported back as an error embed.
+    """
+    name = func.__name__.removeprefix("cmd_")
+
+    @functools.wraps(func)
+    async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+        start = time.perf_counter()
+        await interaction.response.defer(thinking=True)
+
+        try:
+            await func(interaction, *args, **kwargs)
+        except Exception as e:
+            logger.exception("Error in /%s", name)
+            embed = discord.Embed(
+                title="Error",
+                description=f"```\n{str(e)[:3900]}\n```",
+                color=discord.Color.red(),
+            )
+            await interaction.followup.send(embed=embed)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            logger.info("/%s: total=%.0fms", name, elapsed_ms)
+
+    return wrapper
+
+
 # ---------------------------------------------------------------------------
 # Slash commands
 # ---------------------------------------------------------------------------
@@ -285,82 +336,56 @@ async def _resolve_query(token: str, amount: float) -> HoldingQuery | None:
     token="Token ticker symbol (e.g. BONK) or mint address",
     amount="Exact token amount held",
 )
+@with_defer
 async def cmd_find(interaction: discord.Interaction, token: str, amount: float):
-    await interaction.response.defer()
+    token_input = token.strip()
+    if _is_mint(token_input):
+        query = HoldingQuery(
+            ticker=token_input[:8] + "...",
+            token_amount=amount,
+            mint_address=token_input,
+        )
+        result = await bot.matcher.find_candidates(query)
 
-    try:
-        token_input = token.strip()
-        is_mint = bool(MINT_RE.match(token_input))
+        embed = build_search_embed(result)
+        await interaction.followup.send(embed=embed)
+    else:
+        # Resolve ticker — may need disambiguation
+        ticker = token_input.upper()
+        candidates = await bot.resolver.search_by_ticker(ticker)
 
-        if is_mint:
+        if not candidates:
+            embed = discord.Embed(
+                title="Token Not Found",
+                description=f"No tokens found for `{ticker}`",
+                color=discord.Color.red(),
+            )
+            await interaction.followup.send(embed=embed)
+            return
+
+        if len(candidates) == 1:
+            selected = candidates[0]
             query = HoldingQuery(
-                ticker=token_input[:8] + "...",
+                ticker=selected.symbol,
                 token_amount=amount,
-                mint_address=token_input,
+                mint_address=selected.mint_address,
             )
-            matcher = WalletMatcher(bot.config)
-            try:
-                result = await asyncio.to_thread(matcher.find_candidates, query)
-            finally:
-                matcher.close()
+            result = await bot.matcher.find_candidates(query)
 
             embed = build_search_embed(result)
             await interaction.followup.send(embed=embed)
         else:
-            # Resolve ticker — may need disambiguation
-            resolver = TokenResolver()
-            try:
-                candidates = await asyncio.to_thread(
-                    resolver.search_by_ticker, token_input.upper()
-                )
-            finally:
-                resolver.close()
-
-            if not candidates:
-                embed = discord.Embed(
-                    title="Token Not Found",
-                    description=f"No tokens found for `{token_input.upper()}`",
-                    color=discord.Color.red(),
-                )
-                await interaction.followup.send(embed=embed)
-                return
-
-            if len(candidates) == 1:
-                selected = candidates[0]
-                query = HoldingQuery(
-                    ticker=selected.symbol,
-                    token_amount=amount,
-                    mint_address=selected.mint_address,
-                )
-                matcher = WalletMatcher(bot.config)
-                try:
-                    result = await asyncio.to_thread(matcher.find_candidates, query)
-                finally:
-                    matcher.close()
-
-                embed = build_search_embed(result)
-                await interaction.followup.send(embed=embed)
-            else:
-                # Multiple matches — show dropdown
-                view = TokenSelectView(
-                    candidates, amount, bot.config,
-                    original_interaction=interaction,
-                )
-                embed = discord.Embed(
-                    title=f"Multiple tokens found for '{token_input.upper()}'",
-                    description="Select the correct token from the dropdown below.",
-                    color=discord.Color.gold(),
-                )
-                await interaction.followup.send(embed=embed, view=view)
-
-    except Exception as e:
-        logger.exception("Error in /find")
-        embed = discord.Embed(
-            title="Error",
-            description=f"```\n{str(e)[:3900]}\n```",
-            color=discord.Color.red(),
-        )
-        await interaction.followup.send(embed=embed)
+            # Multiple matches — show dropdown
+            view = TokenSelectView(
+                candidates, amount, bot.matcher,
+                original_interaction=interaction,
+            )
+            embed = discord.Embed(
+                title=f"Multiple tokens found for '{ticker}'",
+                description="Select the correct token from the dropdown below.",
+                color=discord.Color.gold(),
+            )
+            await interaction.followup.send(embed=embed, view=view)
 
 
 @bot.tree.command(
@@ -373,6 +398,7 @@ async def cmd_find(interaction: discord.Interaction, token: str, amount: float):
     token2="Second token ticker or mint address",
     amount2="Second token amount held",
 )
+@with_defer
 async def cmd_verify(
     interaction: discord.Interaction,
     token1: str,
@@ -380,45 +406,29 @@ async def cmd_verify(
     token2: str,
     amount2: float,
 ):
-    await interaction.response.defer()
-
-    try:
-        q1 = await _resolve_query(token1, amount1)
-        q2 = await _resolve_query(token2, amount2)
-
-        if q1 is None or q2 is None:
-            missing = []
-            if q1 is None:
-                missing.append(token1)
-            if q2 is None:
-                missing.append(token2)
-            embed = discord.Embed(
-                title="Token Not Found",
-                description=f"Could not resolve: {', '.join(f'`{t}`' for t in missing)}",
-                color=discord.Color.red(),
-            )
-            await interaction.followup.send(embed=embed)
-            return
-
-        matcher = WalletMatcher(bot.config)
-        try:
-            result = await asyncio.to_thread(
-                matcher.verify_with_second_holding, q1, q2
-            )
-        finally:
-            matcher.close()
-
-        embed = build_verification_embed(result)
-        await interaction.followup.send(embed=embed)
+    q1, q2 = await asyncio.gather(
+        _resolve_query(token1, amount1),
+        _resolve_query(token2, amount2),
+    )
 
-    except Exception as e:
-        logger.exception("Error in /verify")
+    if q1 is None or q2 is None:
+        missing = []
+        if q1 is None:
+            missing.append(token1)
+        if q2 is None:
+            missing.append(token2)
         embed = discord.Embed(
-            title="Error",
-            description=f"```\n{str(e)[:3900]}\n```",
+            title="Token Not Found",
+            description=f"Could not resolve: {', '.join(f'`{t}`' for t in missing)}",
             color=discord.Color.red(),
         )
         await interaction.followup.send(embed=embed)
+        return
+
+    result = await bot.matcher.verify_with_second_holding(q1, q2)
+
+    embed = build_verification_embed(result)
+    await interaction.followup.send(embed=embed)
 
 
 # ---------------------------------------------------------------------------
@@ -437,6 +447,13 @@ def main():
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
 
+    # Faster event loop where available (not supported on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     bot.run(token)
 
 
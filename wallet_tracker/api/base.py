@@ -1,14 +1,60 @@
 """Base HTTP client with retry logic and rate limiting."""
 
+import asyncio
+import json
+import random
 import time
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 import httpx
+import orjson
+
+
+def loads_json(content: bytes) -> Any:
+    """Parse a JSON body with orjson, falling back to the stdlib parser."""
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return json.loads(content)
+
+
+async def gather_limited(
+    coros: list[Awaitable[Any]],
+    limit: int,
+    semaphore: asyncio.Semaphore | None = None,
+) -> list[Any]:
+    """
+    Await coroutines concurrently, at most ``limit`` at a time (or as
+    many as ``semaphore`` allows, to share a bound across calls). If one
+    fails, or the caller is cancelled, the rest are cancelled and reaped
+    before the error is raised.
+    """
+    semaphore = semaphore or asyncio.Semaphore(limit)
+
+    async def run(coro: Awaitable[Any]) -> Any:
+        try:
+            async with semaphore:
+                return await coro
+        finally:
+            # One cancelled while still queued for a slot was never started
+            if asyncio.iscoroutine(coro):
+                coro.close()
+
+    tasks = [asyncio.ensure_future(run(coro)) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 class RateLimitError(Exception):
     """Raised when API rate limit is hit."""
-    pass
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class APIError(Exception):
@@ -18,29 +64,74 @@ class APIError(Exception):
         self.status_code = status_code
 
 
+class RateLimiter:
+    """
+    Token-bucket rate limiter for async callers.
+
+    Allows bursts of up to ``rate`` requests, refilling at ``rate``
+    requests per ``period`` seconds.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a request slot is available and take it."""
+        while True:
+            now = time.monotonic()
+            refill = (now - self._updated) * self.rate / self.period
+            self._tokens = min(self.rate, self._tokens + refill)
+            self._updated = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+
 class BaseAPIClient:
     """Base class for API clients with retry and rate limiting support."""
 
+    # Override in subclass to throttle requests (shared by all instances)
+    rate_limiter: RateLimiter | None = None
+
+    # Longest Retry-After we will wait out before giving up (seconds)
+    MAX_RETRY_AFTER = 30.0
+
     def __init__(
         self,
         base_url: str,
         timeout: float = 30.0,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        http2: bool = True,
+        max_connections: int = 50,
     ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self._client: httpx.Client | None = None
+        self.http2 = http2
+        self.max_connections = max_connections
+        self._client: httpx.AsyncClient | None = None
 
     @property
-    def client(self) -> httpx.Client:
+    def client(self) -> httpx.AsyncClient:
         """Lazy initialization of HTTP client."""
         if self._client is None:
-            self._client = httpx.Client(
+            self._client = httpx.AsyncClient(
                 base_url=self.base_url,
+                http2=self.http2,
                 timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=60,
+                ),
                 headers=self._get_default_headers(),
             )
         return self._client
@@ -55,90 +146,108 @@ class BaseAPIClient:
     def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
         """Process response and handle errors."""
         if response.status_code == 429:
-            raise RateLimitError("Rate limit exceeded")
+            try:
+                retry_after = float(response.headers["Retry-After"])
+            except (KeyError, ValueError):
+                retry_after = None
+            raise RateLimitError("Rate limit exceeded", retry_after)
 
         if response.status_code >= 400:
             try:
-                error_data = response.json()
+                error_data = loads_json(response.content)
                 message = error_data.get("message", error_data.get("error", str(error_data)))
             except Exception:
                 message = response.text or f"HTTP {response.status_code}"
             raise APIError(message, response.status_code)
 
         try:
-            return response.json()
+            return loads_json(response.content)
         except Exception:
             return {"raw": response.text}
 
-    def _request(
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff delay with up to 25% random jitter."""
+        delay = self.retry_delay * (2 ** attempt)
+        return delay + random.uniform(0, delay * 0.25)
+
+    async def _with_retries(
         self,
-        method: str,
-        endpoint: str,
-        params: dict[str, Any] | None = None,
-        json_data: dict[str, Any] | None = None,
-        headers: dict[str, str] | None = None,
+        send: Callable[[], Awaitable[httpx.Response]],
     ) -> dict[str, Any]:
-        """Make HTTP request with retry logic."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-
+        """Run ``send`` with rate limiting and retry logic."""
         last_exception: Exception | None = None
 
         for attempt in range(self.max_retries):
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
+
+            last_attempt = attempt == self.max_retries - 1
             try:
-                response = self.client.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json_data,
-                    headers=headers,
-                )
+                response = await send()
                 return self._handle_response(response)
 
-            except RateLimitError:
-                # Exponential backoff for rate limits
-                wait_time = self.retry_delay * (2 ** attempt)
-                time.sleep(wait_time)
-                last_exception = RateLimitError("Rate limit exceeded after retries")
+            except RateLimitError as e:
+                # Honor Retry-After when given, otherwise back off exponentially
+                if e.retry_after is not None:
+                    if e.retry_after > self.MAX_RETRY_AFTER:
+                        raise RateLimitError(
+                            f"Rate limited, retry after {e.retry_after:.0f}s", e.retry_after
+                        )
+                    wait_time = e.retry_after + random.uniform(0, e.retry_after * 0.25)
+                    wait_time = min(wait_time, self.MAX_RETRY_AFTER)
+                else:
+                    wait_time = self._backoff(attempt)
+                last_exception = RateLimitError("Rate limit exceeded after retries", e.retry_after)
 
             except httpx.TimeoutException:
                 last_exception = APIError("Request timed out", None)
-                time.sleep(self.retry_delay)
+                wait_time = self._backoff(attempt)
 
             except httpx.RequestError as e:
                 last_exception = APIError(f"Request failed: {e}", None)
-                time.sleep(self.retry_delay)
+                wait_time = self._backoff(attempt)
+
+            # No point waiting after the final attempt
+            if not last_attempt:
+                await asyncio.sleep(wait_time)
 
         if last_exception:
             raise last_exception
         raise APIError("Request failed after retries")
 
-    def get(
+    async def get(
         self,
         endpoint: str,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
     ) -> dict[str, Any]:
-        """Make GET request."""
-        return self._request("GET", endpoint, params=params, headers=headers)
+        """Make GET request with retry logic."""
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        return await self._with_retries(
+            lambda: self.client.get(url, params=params, headers=headers)
+        )
 
-    def post(
+    async def post(
         self,
         endpoint: str,
         json_data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
     ) -> dict[str, Any]:
-        """Make POST request."""
-        return self._request("POST", endpoint, params=params, json_data=json_data, headers=headers)
+        """Make POST request with retry logic."""
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        return await self._with_retries(
+            lambda: self.client.post(url, json=json_data, params=params, headers=headers)
+        )
 
-    def close(self) -> None:
+    async def close(self) -> None:
         """Close the HTTP client."""
         if self._client:
-            self._client.close()
+            await self._client.aclose()
             self._client = None
 
-    def __enter__(self):
+    async def __aenter__(self):
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
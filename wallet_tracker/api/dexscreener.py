@@ -1,8 +1,12 @@
 """DexScreener API client for token search and pair data."""
 
-from typing import Any
+import asyncio
+from typing import Any, Awaitable, Callable
 
-from .base import BaseAPIClient
+from cachetools import TTLCache
+
+from ..models import TokenInfo
+from .base import BaseAPIClient, RateLimiter
 
 
 class DexScreenerClient(BaseAPIClient):
@@ -10,10 +14,51 @@ class DexScreenerClient(BaseAPIClient):
 
     BASE_URL = "https://api.dexscreener.com"
 
-    def __init__(self):
+    rate_limiter = RateLimiter(60, 60.0)
+
+    # Default liquidity floor for ticker searches (mostly dead/scam pools below)
+    MIN_LIQUIDITY_USD = 1000.0
+    MAX_SEARCH_RESULTS = 50
+
+    # Max mint addresses per /tokens/v1 request
+    MAX_ADDRESSES_PER_REQUEST = 30
+
+    # Search/pair responses are reused for this many seconds
+    CACHE_TTL = 60.0
+    CACHE_SIZE = 1024
+
+    def __init__(self, min_liquidity_usd: float = MIN_LIQUIDITY_USD):
         super().__init__(base_url=self.BASE_URL)
+        self.min_liquidity_usd = min_liquidity_usd
+        self._search_cache: TTLCache = TTLCache(maxsize=self.CACHE_SIZE, ttl=self.CACHE_TTL)
+        self._pairs_cache: TTLCache = TTLCache(maxsize=self.CACHE_SIZE, ttl=self.CACHE_TTL)
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+
+    def clear_cache(self) -> None:
+        """Drop all cached search and pair responses."""
+        self._search_cache.clear()
+        self._pairs_cache.clear()
+
+    async def _coalesced(
+        self,
+        key: tuple[str, str],
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Run ``fetch`` once for concurrent callers sharing ``key``.
 
-    def search_tokens(self, query: str) -> list[dict[str, Any]]:
+        Callers arriving while a request for the same key is in flight
+        wait on that request instead of spending rate-limit quota on a
+        duplicate. A cancelled caller does not cancel it for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def search_tokens(self, query: str) -> list[dict[str, Any]]:
         """
         Search for tokens by name, symbol, or address.
 
@@ -23,10 +68,19 @@ class DexScreenerClient(BaseAPIClient):
         Returns:
             List of matching pairs with token info
         """
-        response = self.get(f"/latest/dex/search", params={"q": query})
-        return response.get("pairs", [])
+        key = query.casefold()
+        if key in self._search_cache:
+            return self._search_cache[key]
+
+        async def fetch() -> list[dict[str, Any]]:
+            response = await self.get(f"/latest/dex/search", params={"q": query})
+            pairs = response.get("pairs", [])
+            self._search_cache[key] = pairs
+            return pairs
 
-    def search_solana_tokens(self, ticker: str) -> list[dict[str, Any]]:
+        return await self._coalesced(("search", key), fetch)
+
+    async def search_solana_tokens(self, ticker: str) -> list[dict[str, Any]]:
         """
         Search for Solana tokens by ticker symbol.
 
@@ -34,17 +88,25 @@ class DexScreenerClient(BaseAPIClient):
             ticker: Token ticker symbol (e.g., "BONK")
 
         Returns:
-            List of Solana token pairs matching the ticker
+            Solana pairs with at least ``min_liquidity_usd`` liquidity,
+            most liquid first (at most MAX_SEARCH_RESULTS). If none clear
+            the threshold, all Solana pairs are returned instead so new or
+            thin tokens can still be found.
         """
-        pairs = self.search_tokens(ticker)
-        # Filter to Solana chain only
-        solana_pairs = [
-            p for p in pairs
+        pairs = await self.search_tokens(ticker)
+
+        # Rank Solana pairs by liquidity, parsing it once per pair
+        solana = [
+            (TokenInfo.extract_liquidity(p), p)
+            for p in pairs
             if p.get("chainId") == "solana"
         ]
-        return solana_pairs
+        ranked = [item for item in solana if item[0] >= self.min_liquidity_usd] or solana
 
-    def get_token_pairs(self, mint_address: str) -> list[dict[str, Any]]:
+        ranked.sort(key=lambda item: item[0], reverse=True)
+        return [p for _, p in ranked[:self.MAX_SEARCH_RESULTS]]
+
+    async def get_token_pairs(self, mint_address: str) -> list[dict[str, Any]]:
         """
         Get all trading pairs for a specific Solana token.
 
@@ -54,10 +116,42 @@ class DexScreenerClient(BaseAPIClient):
         Returns:
             List of trading pairs for the token
         """
-        response = self.get(f"/latest/dex/tokens/{mint_address}")
-        return response.get("pairs", [])
+        if mint_address in self._pairs_cache:
+            return self._pairs_cache[mint_address]
+
+        async def fetch() -> list[dict[str, Any]]:
+            response = await self.get(f"/latest/dex/tokens/{mint_address}")
+            pairs = response.get("pairs", [])
+            self._pairs_cache[mint_address] = pairs
+            return pairs
+
+        return await self._coalesced(("pairs", mint_address), fetch)
+
+    async def get_tokens_by_addresses(
+        self,
+        mint_addresses: list[str],
+    ) -> list[dict[str, Any]]:
+        """
+        Get trading pairs for several Solana tokens in one request.
 
-    def get_pair_info(self, pair_address: str) -> dict[str, Any] | None:
+        Args:
+            mint_addresses: Up to MAX_ADDRESSES_PER_REQUEST mint addresses
+
+        Returns:
+            Trading pairs for all of the given tokens
+        """
+        if len(mint_addresses) > self.MAX_ADDRESSES_PER_REQUEST:
+            raise ValueError(
+                f"At most {self.MAX_ADDRESSES_PER_REQUEST} addresses per request"
+            )
+        if not mint_addresses:
+            return []
+
+        response = await self.get(f"/tokens/v1/solana/{','.join(mint_addresses)}")
+        # This endpoint returns a bare list of pairs
+        return response if isinstance(response, list) else []
+
+    async def get_pair_info(self, pair_address: str) -> dict[str, Any] | None:
         """
         Get detailed info for a specific trading pair.
 
@@ -67,11 +161,11 @@ class DexScreenerClient(BaseAPIClient):
         Returns:
             Pair information dict or None if not found
         """
-        response = self.get(f"/latest/dex/pairs/solana/{pair_address}")
+        response = await self.get(f"/latest/dex/pairs/solana/{pair_address}")
         pairs = response.get("pairs", [])
         return pairs[0] if pairs else None
 
-    def get_token_by_address(self, mint_address: str) -> dict[str, Any] | None:
+    async def get_token_by_address(self, mint_address: str) -> dict[str, Any] | None:
         """
         Get token info by mint address.
 
@@ -81,17 +175,12 @@ class DexScreenerClient(BaseAPIClient):
         Returns:
             Token info from the most liquid pair, or None
         """
-        pairs = self.get_token_pairs(mint_address)
+        pairs = await self.get_token_pairs(mint_address)
         if not pairs:
             return None
 
         # Return info from the most liquid pair
-        pairs_sorted = sorted(
-            pairs,
-            key=lambda p: float(p.get("liquidity", {}).get("usd", 0) or 0),
-            reverse=True
-        )
-        return pairs_sorted[0] if pairs_sorted else None
+        return max(pairs, key=TokenInfo.extract_liquidity)
 
     def extract_token_info(self, pair_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -111,7 +200,7 @@ class DexScreenerClient(BaseAPIClient):
             "price_usd": float(pair_data.get("priceUsd", 0) or 0),
             "market_cap": float(pair_data.get("marketCap", 0) or 0),
             "fdv": float(pair_data.get("fdv", 0) or 0),
-            "liquidity_usd": float(pair_data.get("liquidity", {}).get("usd", 0) or 0),
+            "liquidity_usd": TokenInfo.extract_liquidity(pair_data),
             "volume_24h": float(pair_data.get("volume", {}).get("h24", 0) or 0),
             "pair_address": pair_data.get("pairAddress"),
             "dex_id": pair_data.get("dexId"),
@@ -1,10 +1,14 @@
 """Helius API client for token holder lookups."""
 
-from typing import Any
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator
 
 import httpx
+import orjson
 
-from .base import BaseAPIClient, APIError
+from ..models import HolderEntry
+from .base import BaseAPIClient, APIError, RateLimiter
 
 
 class HeliusClient(BaseAPIClient):
@@ -18,12 +22,29 @@ class HeliusClient(BaseAPIClient):
     BASE_URL = "https://api.helius.xyz"
     RPC_BASE_URL = "https://mainnet.helius-rpc.com"
 
+    # Free tier allows 10 RPC requests per second
+    rate_limiter = RateLimiter(10, 1.0)
+
     def __init__(self, api_key: str):
         super().__init__(base_url=self.BASE_URL)
         self.api_key = api_key
         self.rpc_url = f"{self.RPC_BASE_URL}/?api-key={api_key}"
+        self._rpc_client: httpx.AsyncClient | None = None
+        self._supply_cache: dict[str, dict[str, Any]] = {}
+
+    @property
+    def rpc_client(self) -> httpx.AsyncClient:
+        """Lazy initialization of the RPC client (HTTP/2, shared across calls)."""
+        if self._rpc_client is None:
+            self._rpc_client = httpx.AsyncClient(
+                base_url=self.RPC_BASE_URL,
+                http2=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            )
+        return self._rpc_client
 
-    def rpc_request(self, method: str, params: Any) -> Any:
+    async def rpc_request(self, method: str, params: Any) -> Any:
         """
         Make a JSON-RPC request to Helius RPC endpoint.
 
@@ -41,16 +62,26 @@ class HeliusClient(BaseAPIClient):
             "params": params,
         }
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(self.rpc_url, json=payload)
-            data = response.json()
+        content = orjson.dumps(payload)
+        data = await self._with_retries(
+            lambda: self.rpc_client.post(
+                "/",
+                params={"api-key": self.api_key},
+                content=content,
+                headers={"Content-Type": "application/json"},
+            )
+        )
 
-            if "error" in data:
-                raise APIError(f"RPC Error: {data['error']}")
+        # A non-JSON body comes back as {"raw": ...}; never read it as "no data"
+        if not isinstance(data, dict) or ("result" not in data and "error" not in data):
+            raise APIError(f"Invalid RPC response for {method}")
 
-            return data.get("result")
+        if "error" in data:
+            raise APIError(f"RPC Error: {data['error']}")
 
-    def get_token_accounts(
+        return data["result"]
+
+    async def get_token_accounts(
         self,
         mint: str,
         page: int = 1,
@@ -69,7 +100,7 @@ class HeliusClient(BaseAPIClient):
         Returns:
             List of token account dicts
         """
-        result = self.rpc_request(
+        result = await self.rpc_request(
             "getTokenAccounts",
             {
                 "page": page,
@@ -83,10 +114,78 @@ class HeliusClient(BaseAPIClient):
             return result["token_accounts"]
         return []
 
-    def get_all_holders(
+    async def iter_all_holders(
+        self,
+        mint: str,
+        max_pages: int = 50,
+        concurrency: int = 8,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream ALL token holders for a mint, one account at a time.
+
+        Page 1 is fetched first; if it is full, up to ``concurrency``
+        following pages are kept in flight while the current page is
+        being consumed, so callers can process accounts as they arrive.
+        At most ``concurrency + 1`` pages are held in memory at once; the
+        full holder list is never materialized.
+
+        Args:
+            mint: Token mint address
+            max_pages: Safety limit on pages to fetch
+            concurrency: Number of pages prefetched at once
+
+        Yields:
+            Token account dicts with ``owner`` and ``amount`` set, in page
+            order (malformed records are dropped)
+        """
+        accounts = await self.get_token_accounts(mint, page=1, limit=1000)
+        for acct in self._valid_accounts(accounts):
+            yield acct
+        if len(accounts) < 1000:
+            return
+
+        pending: deque[asyncio.Task] = deque()
+        next_page = 2
+        # Set once any page comes back short: no later page can have data
+        exhausted = False
+
+        def on_page_done(task: asyncio.Task) -> None:
+            nonlocal exhausted
+            if not task.cancelled() and task.exception() is None and len(task.result()) < 1000:
+                exhausted = True
+
+        try:
+            while True:
+                while not exhausted and next_page <= max_pages and len(pending) < concurrency:
+                    task = asyncio.create_task(
+                        self.get_token_accounts(mint, page=next_page, limit=1000)
+                    )
+                    task.add_done_callback(on_page_done)
+                    pending.append(task)
+                    next_page += 1
+                if not pending:
+                    return
+
+                accounts = await pending.popleft()
+                for acct in self._valid_accounts(accounts):
+                    yield acct
+                if len(accounts) < 1000:
+                    return
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    @staticmethod
+    def _valid_accounts(accounts: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Drop records lacking an owner or amount, so consumers can subscript."""
+        return [a for a in accounts if a.get("owner") and a.get("amount") is not None]
+
+    async def get_all_holders(
         self,
         mint: str,
         max_pages: int = 50,
+        concurrency: int = 8,
     ) -> list[dict[str, Any]]:
         """
         Paginate through ALL token holders for a mint.
@@ -94,28 +193,64 @@ class HeliusClient(BaseAPIClient):
         Args:
             mint: Token mint address
             max_pages: Safety limit on pages to fetch
+            concurrency: Number of pages requested at once
+
+        Returns:
+            List of all token account dicts, in page order
+        """
+        return [
+            acct async for acct in self.iter_all_holders(mint, max_pages, concurrency)
+        ]
+
+    async def get_all_holders_typed(
+        self,
+        mint: str,
+        decimals: int = 9,
+        max_pages: int = 50,
+        concurrency: int = 8,
+    ) -> list[HolderEntry]:
+        """
+        Like get_all_holders, but parsed into HolderEntry objects.
+
+        The matcher works on the raw dicts; use this only when typed
+        entries are actually needed.
+
+        Args:
+            mint: Token mint address
+            decimals: Token decimals, used for ``ui_amount``
+            max_pages: Safety limit on pages to fetch
+            concurrency: Number of pages requested at once
 
         Returns:
-            List of all token account dicts
+            List of HolderEntry, in page order
+        """
+        return [
+            HolderEntry.from_helius(acct, decimals)
+            async for acct in self.iter_all_holders(mint, max_pages, concurrency)
+        ]
+
+    async def get_token_supply(self, mint: str) -> dict[str, Any]:
+        """
+        Get token supply info including decimals.
+
+        Results are cached per mint for the life of the client; callers
+        only rely on ``decimals``, which never changes for a mint.
         """
-        all_accounts: list[dict[str, Any]] = []
-        page = 1
-
-        while page <= max_pages:
-            accounts = self.get_token_accounts(mint, page=page, limit=1000)
-            if not accounts:
-                break
-            all_accounts.extend(accounts)
-            if len(accounts) < 1000:
-                break
-            page += 1
-
-        return all_accounts
-
-    def get_token_supply(self, mint: str) -> dict[str, Any]:
-        """Get token supply info including decimals."""
-        result = self.rpc_request(
+        if mint in self._supply_cache:
+            return self._supply_cache[mint]
+
+        result = await self.rpc_request(
             "getTokenSupply",
             [mint],
         )
-        return result.get("value", {}) if result else {}
+        value = result.get("value", {}) if result else {}
+        if value:
+            self._supply_cache[mint] = value
+        return value
+
+    async def close(self) -> None:
+        """Close the REST and RPC clients."""
+        await super().close()
+        if self._rpc_client:
+            await self._rpc_client.aclose()
+            self._rpc_client = None
@@ -1,10 +1,28 @@
 """Solana RPC client for direct blockchain queries."""
 
+import asyncio
+import time
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
+import orjson
+from cachetools import TTLCache
 
-from .base import APIError
+from .base import APIError, gather_limited, loads_json
+
+
+class BatchUnsupportedError(APIError):
+    """Raised when an endpoint rejects a JSON-RPC batch payload."""
+
+
+@dataclass
+class _Endpoint:
+    """Health stats for a single RPC endpoint."""
+    url: str
+    latency: float = 0.0        # EWMA of successful request latency (seconds)
+    failures: int = 0           # Consecutive failed requests
+    open_until: float = 0.0     # Circuit breaker: skip until this monotonic time
 
 
 class SolanaRPCClient:
@@ -12,6 +30,9 @@ class SolanaRPCClient:
     Client for Solana JSON-RPC API.
 
     Uses public RPC endpoints or Helius RPC for better reliability.
+    When several endpoints are configured, each request is hedged across
+    the two fastest healthy ones (unless they are the public defaults)
+    and fails over to the rest on error.
     """
 
     # Public RPC endpoints (fallbacks)
@@ -20,17 +41,141 @@ class SolanaRPCClient:
         "https://solana-mainnet.rpc.extrnode.com",
     ]
 
-    def __init__(self, rpc_url: str | None = None):
+    # Max calls per JSON-RPC batch request (providers cap batch size)
+    BATCH_SIZE = 100
+
+    # Max HTTP requests in flight for fan-out helpers
+    MAX_CONCURRENCY = 16
+
+    # Token supply responses are reused for this many seconds
+    SUPPLY_CACHE_TTL = 300.0
+
+    # A fetched slot is extrapolated from for this many seconds
+    SLOT_CACHE_TTL = 2.0
+
+    # Commitment levels, weakest first
+    COMMITMENT_LEVELS = ("processed", "confirmed", "finalized")
+
+    # Endpoint health tracking
+    LATENCY_EWMA_ALPHA = 0.3    # Weight of the newest latency sample
+    BREAKER_THRESHOLD = 3       # Consecutive failures before skipping an endpoint
+    BREAKER_COOLDOWN = 30.0     # Seconds an endpoint is skipped after tripping
+
+    def __init__(
+        self,
+        rpc_url: str | None = None,
+        rpc_urls: list[str] | None = None,
+        hedge: bool | None = None,
+    ):
         """
         Initialize Solana RPC client.
 
         Args:
             rpc_url: Custom RPC URL (e.g., Helius RPC with API key)
+            rpc_urls: Several RPC URLs to hedge/fail over between
+                (defaults to ``rpc_url``, or PUBLIC_RPCS if neither is given)
+            hedge: Race each request against the two fastest endpoints
+                (defaults to on, except for PUBLIC_RPCS: doubling every
+                call against rate-limited public nodes only earns 429s)
         """
-        self.rpc_url = rpc_url or self.PUBLIC_RPCS[0]
+        urls = rpc_urls or ([rpc_url] if rpc_url else self.PUBLIC_RPCS)
+        self._endpoints = [_Endpoint(url) for url in urls]
+        self.rpc_url = urls[0]
+        using_public = not (rpc_urls or rpc_url)
+        self.hedge = not using_public if hedge is None else hedge
         self.timeout = 30.0
+        self._client: httpx.AsyncClient | None = None
+        self._supply_cache: TTLCache = TTLCache(maxsize=1024, ttl=self.SUPPLY_CACHE_TTL)
+        self._slot_cache: tuple[int, float] | None = None   # (slot, wall time)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Lazy initialization of HTTP client (HTTP/2, kept alive across calls)."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            )
+        return self._client
+
+    async def _post_endpoint(self, endpoint: _Endpoint, payload: Any) -> Any:
+        """POST a payload to one endpoint, updating its health stats."""
+        start = time.monotonic()
+        try:
+            response = await self.client.post(
+                endpoint.url,
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+            )
+            if response.status_code == 429 or response.status_code >= 500:
+                raise APIError(f"HTTP {response.status_code}", response.status_code)
+            data = loads_json(response.content)
+        except asyncio.CancelledError:
+            # Lost a hedged race: it took at least this long
+            self._record_latency(endpoint, time.monotonic() - start)
+            raise
+        except (httpx.HTTPError, APIError, ValueError):
+            endpoint.failures += 1
+            if endpoint.failures >= self.BREAKER_THRESHOLD:
+                endpoint.open_until = time.monotonic() + self.BREAKER_COOLDOWN
+            raise
+
+        self._record_latency(endpoint, time.monotonic() - start)
+        endpoint.failures = 0
+        return data
+
+    def _record_latency(self, endpoint: _Endpoint, elapsed: float) -> None:
+        """Fold a latency sample into the endpoint's EWMA."""
+        if endpoint.latency:
+            alpha = self.LATENCY_EWMA_ALPHA
+            endpoint.latency = (1 - alpha) * endpoint.latency + alpha * elapsed
+        else:
+            endpoint.latency = elapsed
+
+    async def _post(self, payload: Any) -> Any:
+        """
+        POST a JSON-RPC payload with hedging and failover.
 
-    def _request(self, method: str, params: list[Any]) -> Any:
+        The fastest healthy endpoints are raced (two when hedging) and
+        the loser is cancelled; if they all fail, the remaining endpoints,
+        including ones with an open circuit breaker, are tried in turn.
+        """
+        now = time.monotonic()
+        healthy = sorted(
+            (e for e in self._endpoints if e.open_until <= now),
+            key=lambda e: (e.failures, e.latency),
+        )
+        tripped = [e for e in self._endpoints if e not in healthy]
+
+        first = healthy[:2 if self.hedge else 1] or tripped[:1]
+        rest = [e for e in healthy + tripped if e not in first]
+
+        last_error: Exception | None = None
+
+        pending = {asyncio.create_task(self._post_endpoint(e, payload)) for e in first}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    last_error = task.exception()
+        finally:
+            # Reap the hedged loser so it isn't left running or unretrieved
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for endpoint in rest:
+            try:
+                return await self._post_endpoint(endpoint, payload)
+            except (httpx.HTTPError, APIError, ValueError) as e:
+                last_error = e
+
+        raise APIError(f"All RPC endpoints failed: {last_error}") from last_error
+
+    async def _request(self, method: str, params: list[Any]) -> Any:
         """Make JSON-RPC request."""
         payload = {
             "jsonrpc": "2.0",
@@ -39,17 +184,45 @@ class SolanaRPCClient:
             "params": params,
         }
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(self.rpc_url, json=payload)
-            data = response.json()
+        data = await self._post(payload)
 
-            if "error" in data:
-                error = data["error"]
-                raise APIError(f"RPC Error: {error.get('message', error)}")
+        if "error" in data:
+            error = data["error"]
+            raise APIError(f"RPC Error: {error.get('message', error)}")
 
-            return data.get("result")
+        return data.get("result")
 
-    def get_token_supply(self, mint_address: str) -> dict[str, Any]:
+    async def _batch_request(self, calls: list[tuple[str, list[Any]]]) -> list[Any]:
+        """
+        Make a JSON-RPC batch request.
+
+        Args:
+            calls: (method, params) pairs
+
+        Returns:
+            Results in the same order as ``calls`` (None for failed calls)
+        """
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+
+        data = await self._post(payload)
+
+        # A single object instead of a list means the batch itself was refused
+        if isinstance(data, dict):
+            error = data.get("error", data)
+            raise BatchUnsupportedError(f"RPC Error: {error.get('message', error)}")
+
+        # Responses may come back in any order; match them up by id
+        results: list[Any] = [None] * len(calls)
+        for item in data:
+            idx = item.get("id")
+            if isinstance(idx, int) and 0 <= idx < len(calls) and "error" not in item:
+                results[idx] = item.get("result")
+        return results
+
+    async def get_token_supply(self, mint_address: str) -> dict[str, Any]:
         """
         Get the total supply of a token.
 
@@ -58,11 +231,18 @@ class SolanaRPCClient:
 
         Returns:
             Token supply info with amount, decimals, uiAmount
+            (cached per mint for SUPPLY_CACHE_TTL seconds)
         """
-        result = self._request("getTokenSupply", [mint_address])
-        return result.get("value", {}) if result else {}
+        if mint_address in self._supply_cache:
+            return self._supply_cache[mint_address]
+
+        result = await self._request("getTokenSupply", [mint_address])
+        value = result.get("value", {}) if result else {}
+        if value:
+            self._supply_cache[mint_address] = value
+        return value
 
-    def get_token_supply_ui(self, mint_address: str) -> float:
+    async def get_token_supply_ui(self, mint_address: str) -> float:
         """
         Get token supply as a human-readable float.
 
@@ -72,10 +252,10 @@ class SolanaRPCClient:
         Returns:
             Token supply as float
         """
-        supply_info = self.get_token_supply(mint_address)
+        supply_info = await self.get_token_supply(mint_address)
         return float(supply_info.get("uiAmount", 0) or 0)
 
-    def get_account_info(self, address: str) -> dict[str, Any] | None:
+    async def get_account_info(self, address: str) -> dict[str, Any] | None:
         """
         Get account info for an address.
 
@@ -85,17 +265,17 @@ class SolanaRPCClient:
         Returns:
             Account info or None
         """
-        result = self._request(
+        result = await self._request(
             "getAccountInfo",
             [address, {"encoding": "jsonParsed"}]
         )
         return result.get("value") if result else None
 
-    def get_slot(self) -> int:
+    async def get_slot(self) -> int:
         """Get current slot number."""
-        return self._request("getSlot", [])
+        return await self._request("getSlot", [])
 
-    def get_block_time(self, slot: int) -> int | None:
+    async def get_block_time(self, slot: int) -> int | None:
         """
         Get Unix timestamp for a slot.
 
@@ -105,13 +285,15 @@ class SolanaRPCClient:
         Returns:
             Unix timestamp or None
         """
-        return self._request("getBlockTime", [slot])
+        return await self._request("getBlockTime", [slot])
 
-    def estimate_slot_for_timestamp(self, target_timestamp: int) -> int:
+    async def estimate_slot_for_timestamp(self, target_timestamp: int) -> int:
         """
         Estimate the slot number for a given timestamp.
 
-        Solana produces ~2.5 slots per second on average.
+        Solana produces ~2.5 slots per second on average. The current
+        slot is fetched at most once per SLOT_CACHE_TTL and extrapolated
+        in between, so back-to-back estimates share one getSlot call.
 
         Args:
             target_timestamp: Unix timestamp
@@ -119,20 +301,25 @@ class SolanaRPCClient:
         Returns:
             Estimated slot number
         """
-        import time
-
-        current_slot = self.get_slot()
-        current_time = int(time.time())
-
         # Average slot time is ~400ms
         slots_per_second = 2.5
+
+        now = time.time()
+        if self._slot_cache and now - self._slot_cache[1] < self.SLOT_CACHE_TTL:
+            cached_slot, cached_time = self._slot_cache
+            current_slot = cached_slot + int((now - cached_time) * slots_per_second)
+        else:
+            current_slot = await self.get_slot()
+            self._slot_cache = (current_slot, now)
+        current_time = int(now)
+
         time_diff = current_time - target_timestamp
         slot_diff = int(time_diff * slots_per_second)
 
         estimated_slot = current_slot - slot_diff
         return max(0, estimated_slot)
 
-    def get_signatures_for_address(
+    async def get_signatures_for_address(
         self,
         address: str,
         limit: int = 1000,
@@ -157,10 +344,10 @@ class SolanaRPCClient:
         if until:
             params["until"] = until
 
-        result = self._request("getSignaturesForAddress", [address, params])
+        result = await self._request("getSignaturesForAddress", [address, params])
         return result if result else []
 
-    def get_transaction(
+    async def get_transaction(
         self,
         signature: str,
         encoding: str = "jsonParsed",
@@ -175,13 +362,13 @@ class SolanaRPCClient:
         Returns:
             Transaction data or None
         """
-        result = self._request(
+        result = await self._request(
             "getTransaction",
             [signature, {"encoding": encoding, "maxSupportedTransactionVersion": 0}]
         )
         return result
 
-    def get_multiple_transactions(
+    async def get_multiple_transactions(
         self,
         signatures: list[str],
         encoding: str = "jsonParsed",
@@ -189,7 +376,10 @@ class SolanaRPCClient:
         """
         Get multiple transactions by signature.
 
-        Note: Makes individual requests - no batch RPC support.
+        Uses JSON-RPC batch requests of BATCH_SIZE signatures, sent
+        concurrently. A chunk whose batch the endpoint refuses falls back
+        to individual requests; any other failure propagates and cancels
+        the remaining chunks.
 
         Args:
             signatures: List of transaction signatures
@@ -198,11 +388,136 @@ class SolanaRPCClient:
         Returns:
             List of transaction data (may contain None for failed lookups)
         """
-        results = []
-        for sig in signatures:
+        options = {"encoding": encoding, "maxSupportedTransactionVersion": 0}
+        chunks = [
+            signatures[i:i + self.BATCH_SIZE]
+            for i in range(0, len(signatures), self.BATCH_SIZE)
+        ]
+
+        # Shared by all falling-back chunks so they stay bounded together
+        fallback_limit = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def fetch_chunk(chunk: list[str]) -> list[Any]:
             try:
-                tx = self.get_transaction(sig, encoding)
-                results.append(tx)
-            except APIError:
-                results.append(None)
-        return results
+                return await self._batch_request(
+                    [("getTransaction", [sig, options]) for sig in chunk]
+                )
+            except BatchUnsupportedError:
+                return await gather_limited(
+                    [self._get_transaction_or_none(sig, encoding) for sig in chunk],
+                    self.MAX_CONCURRENCY,
+                    fallback_limit,
+                )
+
+        batches = await gather_limited(
+            [fetch_chunk(chunk) for chunk in chunks], self.MAX_CONCURRENCY
+        )
+
+        return [tx for batch in batches for tx in batch]
+
+    async def _get_transaction_or_none(
+        self,
+        signature: str,
+        encoding: str,
+    ) -> dict[str, Any] | None:
+        """get_transaction that returns None instead of raising APIError."""
+        try:
+            return await self.get_transaction(signature, encoding)
+        except APIError:
+            return None
+
+    async def wait_for_signature(
+        self,
+        signature: str,
+        commitment: str = "confirmed",
+        timeout: float = 60.0,
+    ) -> dict[str, Any]:
+        """
+        Wait for a transaction signature to reach a commitment level.
+
+        Subscribes over the RPC WebSocket (signatureSubscribe) and waits
+        for the push notification instead of polling getSignatureStatuses.
+        The status is checked once after subscribing, since a signature
+        that already landed gets no notification.
+
+        Args:
+            signature: Transaction signature
+            commitment: Commitment level to wait for
+            timeout: Max seconds to wait
+
+        Returns:
+            Notification value, e.g. {"err": None} on success
+        """
+        wanted = self.COMMITMENT_LEVELS.index(commitment)
+        import websockets
+
+        ws_url = self.rpc_url.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+
+        async def subscribe() -> dict[str, Any]:
+            async with websockets.connect(ws_url) as ws:
+                await ws.send(orjson.dumps({
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "signatureSubscribe",
+                    "params": [signature, {"commitment": commitment}],
+                }).decode())
+
+                ack = loads_json(await ws.recv())
+                if "error" in ack:
+                    error = ack["error"]
+                    raise APIError(f"RPC Error: {error.get('message', error)}")
+                subscription_id = ack.get("result")
+
+                value = await self._landed_status(signature, wanted)
+                while value is None:
+                    message = loads_json(await ws.recv())
+                    if message.get("method") == "signatureNotification":
+                        value = message["params"]["result"]["value"]
+
+                # Signature subscriptions end after one notification, but be explicit
+                await ws.send(orjson.dumps({
+                    "jsonrpc": "2.0",
+                    "id": 2,
+                    "method": "signatureUnsubscribe",
+                    "params": [subscription_id],
+                }).decode())
+                return value
+
+        try:
+            return await asyncio.wait_for(subscribe(), timeout)
+        except asyncio.TimeoutError:
+            raise APIError(f"Timed out waiting for signature {signature}") from None
+
+    async def _landed_status(self, signature: str, wanted: int) -> dict[str, Any] | None:
+        """
+        Status value for a signature already at commitment level ``wanted``.
+
+        Returns None if it hasn't got there yet or the lookup fails, in
+        which case the caller keeps waiting on its subscription.
+        """
+        try:
+            result = await self._request(
+                "getSignatureStatuses",
+                [[signature], {"searchTransactionHistory": True}],
+            )
+        except APIError:
+            return None
+
+        status = ((result or {}).get("value") or [None])[0]
+        if not status or status.get("confirmationStatus") not in self.COMMITMENT_LEVELS:
+            return None
+        if self.COMMITMENT_LEVELS.index(status["confirmationStatus"]) < wanted:
+            return None
+        return {"err": status.get("err")}
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
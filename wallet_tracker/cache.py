@@ -0,0 +1,92 @@
+"""Persistent on-disk cache for token lookups."""
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "wallet_tracker" / "tokens.sqlite3"
+
+
+class TokenCache:
+    """
+    SQLite-backed cache of DexScreener pair data and token supply per mint.
+
+    Pair data (price, liquidity) goes stale quickly, while supply rarely
+    changes, so the two are stored and expired separately: refreshing a
+    price does not invalidate the cached supply.
+
+    Calls are synchronous and block the event loop while they run. Each
+    is a single-row lookup or upsert on a local WAL database, well under
+    a millisecond, so async callers use it inline rather than paying for
+    a thread hop.
+    """
+
+    PAIR_TTL = 5 * 60           # Seconds pair data stays fresh
+    SUPPLY_TTL = 24 * 60 * 60   # Seconds supply stays fresh
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_CACHE_PATH,
+        pair_ttl: float = PAIR_TTL,
+        supply_ttl: float = SUPPLY_TTL,
+    ):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.pair_ttl = pair_ttl
+        self.supply_ttl = supply_ttl
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tokens ("
+            " mint TEXT PRIMARY KEY,"
+            " json BLOB,"
+            " fetched_at INTEGER,"
+            " supply REAL,"
+            " supply_fetched_at INTEGER)"
+        )
+        self._conn.commit()
+
+    def get_pair(self, mint: str) -> dict[str, Any] | None:
+        """Cached pair data for a mint, or None if missing or stale."""
+        row = self._conn.execute(
+            "SELECT json FROM tokens WHERE mint = ? AND fetched_at >= ?",
+            (mint, time.time() - self.pair_ttl),
+        ).fetchone()
+        return orjson.loads(row[0]) if row and row[0] is not None else None
+
+    def put_pair(self, mint: str, pair: dict[str, Any]) -> None:
+        """Store pair data for a mint."""
+        self._conn.execute(
+            "INSERT INTO tokens (mint, json, fetched_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(mint) DO UPDATE SET "
+            "json = excluded.json, fetched_at = excluded.fetched_at",
+            (mint, orjson.dumps(pair), int(time.time())),
+        )
+        self._conn.commit()
+
+    def get_supply(self, mint: str) -> float | None:
+        """Cached UI supply for a mint, or None if missing or stale."""
+        row = self._conn.execute(
+            "SELECT supply FROM tokens WHERE mint = ? AND supply_fetched_at >= ?",
+            (mint, time.time() - self.supply_ttl),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put_supply(self, mint: str, supply: float) -> None:
+        """Store the UI supply for a mint."""
+        self._conn.execute(
+            "INSERT INTO tokens (mint, supply, supply_fetched_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(mint) DO UPDATE SET "
+            "supply = excluded.supply, supply_fetched_at = excluded.supply_fetched_at",
+            (mint, supply, int(time.time())),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -1,6 +1,8 @@
 """Command-line interface for the wallet tracker."""
 
+import asyncio
 import os
+import re
 import sys
 
 # Fix Windows encoding issues
@@ -25,6 +27,9 @@ from .token_resolver import TokenResolver
 
 console = Console(force_terminal=True)
 
+_MINT_RE = re.compile(r'^[1-9A-HJ-NP-Za-km-z]{32,44}\Z')
+_B58_FIRST = frozenset("123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz")
+
 
 def print_banner():
     """Print the application banner."""
@@ -41,11 +46,15 @@ def print_banner():
 
 def _is_mint_address(value: str) -> bool:
     """Check if a string looks like a Solana mint address (base58, 32-44 chars)."""
-    import re
-    return bool(re.match(r'^[1-9A-HJ-NP-Za-km-z]{32,44}$', value))
+    # Cheap checks first: tickers are short and never reach the regex
+    return (
+        32 <= len(value) <= 44
+        and value[0] in _B58_FIRST
+        and _MINT_RE.match(value) is not None
+    )
 
 
-def _select_token(ticker: str) -> TokenInfo | None:
+async def _select_token(ticker: str) -> TokenInfo | None:
     """
     Search for a ticker and let the user pick the correct token
     when multiple matches exist.
@@ -55,7 +64,7 @@ def _select_token(ticker: str) -> TokenInfo | None:
     """
     resolver = TokenResolver()
     try:
-        candidates = resolver.search_by_ticker(ticker)
+        candidates = await resolver.search_by_ticker(ticker)
 
         if not candidates:
             console.print(f"[red]No tokens found for ticker: {ticker}[/red]")
@@ -99,10 +108,10 @@ def _select_token(ticker: str) -> TokenInfo | None:
             console.print("[red]Invalid selection, using first result.[/red]")
             return candidates[0]
     finally:
-        resolver.close()
+        await resolver.close()
 
 
-def get_holding_input(label: str = "holding") -> HoldingQuery:
+async def get_holding_input(label: str = "holding") -> HoldingQuery:
     """
     Interactively get holding details from user.
 
@@ -121,7 +130,8 @@ def get_holding_input(label: str = "holding") -> HoldingQuery:
     token_input = Prompt.ask("  Token").strip()
     token_amount = FloatPrompt.ask("  Exact token amount held")
 
-    query = HoldingQuery(ticker=token_input.upper(), token_amount=token_amount)
+    ticker = token_input.upper()
+    query = HoldingQuery(ticker=ticker, token_amount=token_amount)
 
     # If it looks like a mint address, set it directly
     if _is_mint_address(token_input):
@@ -129,7 +139,7 @@ def get_holding_input(label: str = "holding") -> HoldingQuery:
         query.ticker = token_input[:8] + "..."
     else:
         # Search by ticker and let user disambiguate
-        token = _select_token(token_input.upper())
+        token = await _select_token(ticker)
         if token:
             query.mint_address = token.mint_address
             query.ticker = token.symbol
@@ -185,7 +195,7 @@ def display_search_result(result: SearchResult):
         # Get the balance from holdings dict
         balance = "N/A"
         if match.holdings:
-            amt = list(match.holdings.values())[0]
+            amt = next(iter(match.holdings.values()))
             balance = f"{amt:,.6f}"
 
         table.add_row(
@@ -222,13 +232,13 @@ def display_verification_result(result: VerificationResult):
             f"[bold red]NO MATCHES[/bold red]\n\n"
             f"No wallet found holding both specified token amounts.\n\n"
             f"Primary holding candidates: {len(result.primary_candidates)}\n"
-            f"Verification holding candidates: {len(result.verification_candidates)}",
+            f"Of those, matching verification holding: {len(result.verification_candidates)}",
             title="Verification Failed",
             border_style="red",
         ))
 
 
-def interactive_search():
+async def interactive_search():
     """Run interactive wallet search."""
     try:
         config = Config.load()
@@ -240,10 +250,10 @@ def interactive_search():
 
     try:
         # Get primary holding
-        primary = get_holding_input("PRIMARY")
+        primary = await get_holding_input("PRIMARY")
 
         console.print("\n[bold]Searching holders...[/bold]")
-        result = matcher.find_candidates(primary)
+        result = await matcher.find_candidates(primary)
 
         display_search_result(result)
 
@@ -251,10 +261,10 @@ def interactive_search():
         if result.candidates and len(result.candidates) > 1:
             console.print()
             if Confirm.ask("Multiple candidates found. Add verification holding?"):
-                verification = get_holding_input("VERIFICATION")
+                verification = await get_holding_input("VERIFICATION")
 
                 console.print("\n[bold]Verifying...[/bold]")
-                verify_result = matcher.verify_with_second_holding(
+                verify_result = await matcher.verify_with_second_holding(
                     primary, verification
                 )
 
@@ -270,10 +280,10 @@ def interactive_search():
             ))
 
     finally:
-        matcher.close()
+        await matcher.close()
 
 
-def test_token_resolution(ticker: str):
+async def test_token_resolution(ticker: str):
     """Test token resolution for a ticker."""
     from .token_resolver import TokenResolver
 
@@ -281,7 +291,7 @@ def test_token_resolution(ticker: str):
 
     resolver = TokenResolver()
     try:
-        tokens = resolver.search_by_ticker(ticker)
+        tokens = await resolver.search_by_ticker(ticker)
 
         if not tokens:
             console.print(f"[red]No tokens found for ticker: {ticker}[/red]")
@@ -305,7 +315,7 @@ def test_token_resolution(ticker: str):
 
         console.print(table)
     finally:
-        resolver.close()
+        await resolver.close()
 
 
 def main():
@@ -315,7 +325,7 @@ def main():
     # Check for command line arguments
     if len(sys.argv) > 1:
         if sys.argv[1] == "--test-token" and len(sys.argv) > 2:
-            test_token_resolution(sys.argv[2])
+            asyncio.run(test_token_resolution(sys.argv[2]))
             return
         elif sys.argv[1] == "--help":
             console.print("""
@@ -337,7 +347,7 @@ def main():
             return
 
     # Run interactive search
-    interactive_search()
+    asyncio.run(interactive_search())
 
 
 if __name__ == "__main__":
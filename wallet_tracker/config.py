@@ -1,5 +1,6 @@
 """Configuration management for the wallet tracker."""
 
+import functools
 import json
 import os
 from dataclasses import dataclass
@@ -24,8 +25,16 @@ _DEFAULTS = {
 
 def _load_config_json() -> dict:
     """Load config.json from project root. Returns empty dict if missing."""
-    if not _config_path.exists():
+    try:
+        mtime = _config_path.stat().st_mtime_ns
+    except OSError:
         return {}
+    return _load_config_json_cached(mtime)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_json_cached(mtime: int) -> dict:
+    """Parse config.json; keyed by mtime so edits are picked up."""
     try:
         with open(_config_path, "r") as f:
             return json.load(f)
@@ -1,13 +1,13 @@
 """Wallet matching engine - find wallets by token holdings."""
 
 import time
-from collections import defaultdict
 from typing import Any
 
+import numpy as np
+
 from .api.helius import HeliusClient
 from .config import Config, get_config
 from .models import (
-    HolderEntry,
     HoldingQuery,
     SearchResult,
     VerificationResult,
@@ -16,6 +16,38 @@ from .models import (
 from .token_resolver import TokenResolver
 
 
+def _match_amount_np(
+    owner_totals: dict[str, int],
+    target: int,
+    tolerance: int,
+) -> list[tuple[str, int]]:
+    """
+    Select owners whose raw balance is within ``tolerance`` of ``target``.
+
+    The comparison is vectorized over an int64 array, so the Python-level
+    loop only runs over the matches. Balances that do not fit in int64
+    fall back to a plain scan.
+
+    Args:
+        owner_totals: Owner address -> raw token balance
+        target: Target raw balance
+        tolerance: Allowed absolute difference in raw units
+
+    Returns:
+        (owner, raw balance) pairs for matching owners, in input order
+    """
+    owners = list(owner_totals)
+    try:
+        totals = np.fromiter(owner_totals.values(), dtype=np.int64, count=len(owners))
+        hits = np.flatnonzero(np.abs(totals - target) <= tolerance)
+    except OverflowError:
+        return [
+            (owner, held) for owner, held in owner_totals.items()
+            if abs(held - target) <= tolerance
+        ]
+    return [(owners[i], int(totals[i])) for i in hits]
+
+
 class WalletMatcher:
     """
     Core wallet matching engine.
@@ -41,12 +73,18 @@ class WalletMatcher:
             self._helius = HeliusClient(self.config.helius_api_key)
         return self._helius
 
-    def find_candidates(self, query: HoldingQuery) -> SearchResult:
+    async def find_candidates(
+        self,
+        query: HoldingQuery,
+        candidate_addresses: set[str] | None = None,
+    ) -> SearchResult:
         """
         Find wallets holding an exact amount of a token.
 
         Args:
             query: Ticker + exact token amount
+            candidate_addresses: If given, only these wallets are considered;
+                all other holders are skipped during aggregation
 
         Returns:
             SearchResult with matching wallets
@@ -56,9 +94,9 @@ class WalletMatcher:
         # Step 1: Resolve ticker to mint address
         # If mint_address is already set (e.g. user pasted it or selected from list), use it directly
         if query.mint_address:
-            token = self.resolver.get_by_mint_address(query.mint_address)
+            token = await self.resolver.get_by_mint_address(query.mint_address)
         else:
-            token = self.resolver.resolve(query.ticker)
+            token = await self.resolver.resolve(query.ticker)
 
         if not token:
             return SearchResult(
@@ -71,32 +109,52 @@ class WalletMatcher:
         query.mint_address = token.mint_address
 
         # Step 2: Get decimals
-        supply_info = self.helius.get_token_supply(token.mint_address)
+        supply_info = await self.helius.get_token_supply(token.mint_address)
         decimals = supply_info.get("decimals", 9)
         query.decimals = decimals
         token.decimals = decimals
 
-        # Step 3: Paginate through all holders
-        raw_accounts = self.helius.get_all_holders(token.mint_address)
-
-        # Step 4: Aggregate by owner (one wallet can have multiple token accounts)
-        owner_totals: dict[str, float] = defaultdict(float)
-        for acct in raw_accounts:
-            owner = acct.get("owner", "")
-            raw_amount = int(acct.get("amount", 0))
-            ui_amount = raw_amount / (10 ** decimals)
-            if owner:
-                owner_totals[owner] += ui_amount
+        # Compare in raw integer units, as stored on chain
+        scale = 10 ** decimals
+        query.raw_amount = round(query.token_amount * scale)
+
+        # Step 3 + 4: Stream all holders, aggregating by owner as pages arrive
+        # (one wallet can have multiple token accounts). A dict is used on
+        # purpose: grouping owner strings with np.unique costs more than
+        # this loop once the strings are converted to an array, and a
+        # bound dict.get beats both defaultdict and Counter here.
+        owner_totals: dict[str, int] = {}
+        get_total = owner_totals.get
+        holders_seen = 0
+        if candidate_addresses is None:
+            # Accounts are validated per page by the Helius client, so
+            # owner and amount can be read directly
+            async for acct in self.helius.iter_all_holders(token.mint_address):
+                owner = acct["owner"]
+                owner_totals[owner] = get_total(owner, 0) + int(acct["amount"])
+            holders_seen = len(owner_totals)
+        elif candidate_addresses:
+            # Plain set membership: a Bloom-filter prescreen would need several
+            # Python-level hash probes per row and measures ~15x slower.
+            all_owners: set[str] = set()
+            async for acct in self.helius.iter_all_holders(token.mint_address):
+                owner = acct["owner"]
+                all_owners.add(owner)
+                if owner in candidate_addresses:
+                    owner_totals[owner] = get_total(owner, 0) + int(acct["amount"])
+            holders_seen = len(all_owners)
 
         # Step 5: Match by amount within tolerance
         tolerance = self.config.tolerances.token_amount
-        target = query.token_amount
+        target = query.raw_amount
+        # At least one raw unit, so float rounding of the typed amount can't miss
+        tolerance_raw = max(1, int(target * tolerance))
         candidates: list[WalletMatch] = []
 
-        for owner, held in owner_totals.items():
-            if target > 0 and abs(held - target) / target <= tolerance:
+        if target > 0:
+            for owner, held in _match_amount_np(owner_totals, target, tolerance_raw):
                 match = WalletMatch(address=owner)
-                match.add_holding(token.mint_address, held)
+                match.add_holding(token.mint_address, held / scale)
                 candidates.append(match)
 
         elapsed = int((time.time() - start_time) * 1000)
@@ -105,11 +163,11 @@ class WalletMatcher:
             query=query,
             token_info=token,
             candidates=candidates,
-            total_holders_scanned=len(owner_totals),
+            total_holders_scanned=holders_seen,
             search_time_ms=elapsed,
         )
 
-    def verify_with_second_holding(
+    async def verify_with_second_holding(
         self,
         primary: HoldingQuery,
         verification: HoldingQuery,
@@ -117,7 +175,10 @@ class WalletMatcher:
         """
         Verify a wallet by checking two different token holdings.
 
-        Finds holders matching each query, then intersects.
+        Finds holders matching the primary query, then scans the
+        verification token only for those wallets. The verification
+        candidates are therefore already limited to the intersection,
+        and the second scan is skipped when the primary has no matches.
 
         Args:
             primary: First token + amount
@@ -126,13 +187,12 @@ class WalletMatcher:
         Returns:
             VerificationResult with confirmed wallet(s)
         """
-        result1 = self.find_candidates(primary)
-        result2 = self.find_candidates(verification)
-
+        result1 = await self.find_candidates(primary)
         wallets1 = {m.address for m in result1.candidates}
-        wallets2 = {m.address for m in result2.candidates}
 
-        confirmed = sorted(wallets1 & wallets2)
+        result2 = await self.find_candidates(verification, candidate_addresses=wallets1)
+
+        confirmed = sorted(m.address for m in result2.candidates)
 
         return VerificationResult(
             primary_query=primary,
@@ -142,18 +202,19 @@ class WalletMatcher:
             verification_candidates=result2.candidates,
         )
 
-    def close(self) -> None:
+    async def close(self) -> None:
         """Clean up resources."""
         if self._resolver:
-            self._resolver.close()
+            await self._resolver.close()
         if self._helius:
-            self._helius.close()
+            await self._helius.close()
 
 
-def find_wallet(
+async def find_wallet(
     ticker: str,
     token_amount: float,
     config: Config | None = None,
+    matcher: WalletMatcher | None = None,
 ) -> SearchResult:
     """
     Quick function to find a wallet by token holding.
@@ -162,22 +223,28 @@ def find_wallet(
         ticker: Token ticker symbol
         token_amount: Exact amount of tokens held
         config: Optional config override
+        matcher: Optional matcher to reuse; batch callers should pass one
+            so connections are shared. It is left open for the caller.
 
     Returns:
         SearchResult with candidates
     """
+    query = HoldingQuery(ticker=ticker, token_amount=token_amount)
+    if matcher is not None:
+        return await matcher.find_candidates(query)
+
     matcher = WalletMatcher(config)
     try:
-        query = HoldingQuery(ticker=ticker, token_amount=token_amount)
-        return matcher.find_candidates(query)
+        return await matcher.find_candidates(query)
     finally:
-        matcher.close()
+        await matcher.close()
 
 
-def verify_wallet(
+async def verify_wallet(
     primary: dict[str, Any],
     verification: dict[str, Any],
     config: Config | None = None,
+    matcher: WalletMatcher | None = None,
 ) -> VerificationResult:
     """
     Quick function to verify a wallet using two holdings.
@@ -186,6 +253,7 @@ def verify_wallet(
         primary: Dict with ticker, token_amount
         verification: Same format
         config: Optional config override
+        matcher: Optional matcher to reuse (left open for the caller)
 
     Returns:
         VerificationResult
@@ -193,8 +261,11 @@ def verify_wallet(
     q1 = HoldingQuery(ticker=primary["ticker"], token_amount=primary["token_amount"])
     q2 = HoldingQuery(ticker=verification["ticker"], token_amount=verification["token_amount"])
 
+    if matcher is not None:
+        return await matcher.verify_with_second_holding(q1, q2)
+
     matcher = WalletMatcher(config)
     try:
-        return matcher.verify_with_second_holding(q1, q2)
+        return await matcher.verify_with_second_holding(q1, q2)
     finally:
-        matcher.close()
+        await matcher.close()
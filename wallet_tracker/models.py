@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenInfo:
     """Information about a token."""
     mint_address: str
@@ -19,6 +19,16 @@ class TokenInfo:
     decimals: int = 9
     pair_address: str | None = None
     dex_id: str | None = None
+    effective_mcap: float = field(init=False, default=0.0)  # market_cap, else fdv
+
+    def __post_init__(self) -> None:
+        self.effective_mcap = self.market_cap or self.fdv or 0.0
+
+    @staticmethod
+    def extract_liquidity(data: dict[str, Any]) -> float:
+        """Liquidity in USD from DexScreener pair data (0.0 if missing)."""
+        liquidity = data.get("liquidity")
+        return float(liquidity.get("usd") or 0) if liquidity else 0.0
 
     @classmethod
     def from_dexscreener(cls, data: dict[str, Any]) -> "TokenInfo":
@@ -31,14 +41,14 @@ class TokenInfo:
             price_usd=float(data.get("priceUsd", 0) or 0),
             market_cap=float(data.get("marketCap", 0) or 0),
             fdv=float(data.get("fdv", 0) or 0),
-            liquidity_usd=float(data.get("liquidity", {}).get("usd", 0) or 0),
+            liquidity_usd=cls.extract_liquidity(data),
             volume_24h=float(data.get("volume", {}).get("h24", 0) or 0),
             pair_address=data.get("pairAddress"),
             dex_id=data.get("dexId"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class HolderEntry:
     """A single token holder from Helius getTokenAccounts."""
     owner: str              # Wallet address
@@ -57,7 +67,7 @@ class HolderEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class HoldingQuery:
     """User-provided holding to search for."""
     ticker: str
@@ -66,9 +76,10 @@ class HoldingQuery:
     # Resolved after token lookup
     mint_address: str | None = None
     decimals: int = 9
+    raw_amount: int | None = None   # token_amount in raw units (amount * 10**decimals)
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletMatch:
     """A wallet that matches one or more holding queries."""
     address: str
@@ -103,6 +114,8 @@ class VerificationResult:
     verification_query: HoldingQuery
     confirmed_wallets: list[str]
     primary_candidates: list[WalletMatch]
+    # Only wallets that also matched the primary holding: the verification
+    # token is scanned for primary candidates alone
     verification_candidates: list[WalletMatch]
 
     @property
@@ -1,7 +1,15 @@
 """Token resolution - convert ticker symbols to mint addresses."""
 
+import asyncio
+import sqlite3
+from typing import Any
+
+from cachetools import TTLCache
+
+from .api.base import gather_limited
 from .api.dexscreener import DexScreenerClient
 from .api.solana_rpc import SolanaRPCClient
+from .cache import TokenCache
 from .models import TokenInfo
 
 
@@ -13,57 +21,94 @@ class TokenResolver:
     when multiple tokens share the same ticker.
     """
 
-    def __init__(self, rpc_url: str | None = None):
-        self.dex_client = DexScreenerClient()
+    # Resolved tokens are reused for this many seconds
+    CACHE_TTL = 30.0
+    CACHE_SIZE = 1024
+
+    # Max tickers resolved / supplies fetched at once by the batch helpers
+    MAX_CONCURRENCY = 8
+
+    # Market cap within this fraction of the hint is taken without looking further
+    CLOSE_MCAP_MATCH = 0.05
+
+    def __init__(
+        self,
+        rpc_url: str | None = None,
+        cache_ttl: float = CACHE_TTL,
+        disk_cache: bool = True,
+        min_liquidity_usd: float = DexScreenerClient.MIN_LIQUIDITY_USD,
+    ):
+        self.dex_client = DexScreenerClient(min_liquidity_usd)
         self.rpc_client = SolanaRPCClient(rpc_url)
+        self._ticker_cache: TTLCache = TTLCache(maxsize=self.CACHE_SIZE, ttl=cache_ttl)
+        self._mint_cache: TTLCache = TTLCache(maxsize=self.CACHE_SIZE, ttl=cache_ttl)
 
-    def search_by_ticker(self, ticker: str) -> list[TokenInfo]:
+        # Mint lookups persist across runs (opened on first use)
+        self._disk_cache_enabled = disk_cache
+        self._disk_cache: TokenCache | None = None
+
+    @property
+    def disk_cache(self) -> TokenCache | None:
+        """Lazily opened disk cache; None if disabled or it can't be opened."""
+        if self._disk_cache is None and self._disk_cache_enabled:
+            try:
+                self._disk_cache = TokenCache()
+            except (sqlite3.Error, OSError):
+                self._disk_cache_enabled = False
+        return self._disk_cache
+
+    async def search_by_ticker(
+        self,
+        ticker: str,
+        limit: int | None = None,
+    ) -> list[TokenInfo]:
         """
         Search for tokens by ticker symbol.
 
         Args:
             ticker: Token ticker symbol (e.g., "BONK")
+            limit: Return only the ``limit`` most liquid tokens
 
         Returns:
             List of matching TokenInfo objects, sorted by liquidity
         """
-        pairs = self.dex_client.search_solana_tokens(ticker.upper())
+        ticker_up = ticker.upper()
+        if ticker_up in self._ticker_cache:
+            return self._ticker_cache[ticker_up][:limit]
+
+        pairs = await self.dex_client.search_solana_tokens(ticker_up)
 
         if not pairs:
             return []
 
-        # Group by mint address (multiple pairs can exist for same token)
+        # Group by mint address (multiple pairs can exist for same token).
+        # Pairs arrive most liquid first, so the first pair seen for a mint
+        # is its best one and insertion order is already liquidity order;
+        # later pairs are skipped before any parsing, so TokenInfo is built
+        # exactly once per mint.
         tokens_by_mint: dict[str, TokenInfo] = {}
 
         for pair in pairs:
             base_token = pair.get("baseToken", {})
             mint = base_token.get("address")
 
-            if not mint:
+            if not mint or mint in tokens_by_mint:
                 continue
 
             # Filter to exact ticker matches
             symbol = base_token.get("symbol", "").upper()
-            if symbol != ticker.upper():
+            if symbol != ticker_up:
                 continue
 
-            if mint not in tokens_by_mint:
-                token = TokenInfo.from_dexscreener(pair)
-                tokens_by_mint[mint] = token
-            else:
-                # Update with higher liquidity data if found
-                existing = tokens_by_mint[mint]
-                new_liquidity = float(pair.get("liquidity", {}).get("usd", 0) or 0)
-                if new_liquidity > existing.liquidity_usd:
-                    tokens_by_mint[mint] = TokenInfo.from_dexscreener(pair)
-
-        # Sort by liquidity (most liquid first)
-        tokens = list(tokens_by_mint.values())
-        tokens.sort(key=lambda t: t.liquidity_usd, reverse=True)
+            tokens_by_mint[mint] = TokenInfo.from_dexscreener(pair)
 
-        return tokens
+        # The full list is cached so later calls can ask for any limit
+        tokens = list(tokens_by_mint.values())
+        if tokens:
+            self._ticker_cache[ticker_up] = tokens
+        return tokens[:limit]
 
-    def get_by_mint_address(self, mint_address: str) -> TokenInfo | None:
+    async def get_by_mint_address(self, mint_address: str) -> TokenInfo | None:
         """
         Get token info by mint address.
 
@@ -73,21 +118,79 @@ class TokenResolver:
         Returns:
             TokenInfo or None if not found
         """
-        pair_data = self.dex_client.get_token_by_address(mint_address)
+        if mint_address in self._mint_cache:
+            return self._mint_cache[mint_address]
+
+        # The mint is known up front, so fetch supply from RPC alongside
+        pair_data, supply = await asyncio.gather(
+            self._fetch_pair(mint_address),
+            self._fetch_supply(mint_address),
+        )
         if not pair_data:
             return None
 
         token = TokenInfo.from_dexscreener(pair_data)
-
-        # Fetch supply from RPC
-        try:
-            supply = self.rpc_client.get_token_supply_ui(mint_address)
+        if supply is not None:
             token.supply = supply
-        except Exception:
-            pass
 
+        self._mint_cache[mint_address] = token
         return token
 
+    async def get_by_mint_addresses(
+        self,
+        mint_addresses: list[str],
+    ) -> dict[str, TokenInfo]:
+        """
+        Get token info for many mint addresses at once.
+
+        Uncached mints are looked up in chunks of
+        DexScreenerClient.MAX_ADDRESSES_PER_REQUEST per request, and
+        their supplies are fetched concurrently.
+
+        Args:
+            mint_addresses: Token mint addresses
+
+        Returns:
+            Mint address -> TokenInfo, for the mints that were found
+        """
+        tokens = {m: self._mint_cache[m] for m in mint_addresses if m in self._mint_cache}
+        missing = list(dict.fromkeys(m for m in mint_addresses if m not in tokens))
+        if not missing:
+            return tokens
+
+        size = self.dex_client.MAX_ADDRESSES_PER_REQUEST
+        responses = await asyncio.gather(*(
+            self.dex_client.get_tokens_by_addresses(missing[i:i + size])
+            for i in range(0, len(missing), size)
+        ))
+
+        # Keep the most liquid pair per requested mint
+        wanted = set(missing)
+        best: dict[str, tuple[float, dict]] = {}
+        for pairs in responses:
+            for pair in pairs:
+                mint = (pair.get("baseToken") or {}).get("address")
+                if mint not in wanted:
+                    continue
+                liquidity = TokenInfo.extract_liquidity(pair)
+                current = best.get(mint)
+                if current is None or liquidity > current[0]:
+                    best[mint] = (liquidity, pair)
+
+        found = [TokenInfo.from_dexscreener(pair) for _, pair in best.values()]
+
+        # Fetch supplies from RPC
+        supplies = await gather_limited(
+            [self._fetch_supply(t.mint_address) for t in found], self.MAX_CONCURRENCY
+        )
+        for token, supply in zip(found, supplies):
+            if supply is not None:
+                token.supply = supply
+            self._mint_cache[token.mint_address] = token
+            tokens[token.mint_address] = token
+
+        return tokens
+
     def disambiguate_by_market_cap(
         self,
         candidates: list[TokenInfo],
@@ -111,29 +214,35 @@ class TokenResolver:
         if len(candidates) == 1:
             return candidates[0]
 
+        # Only market caps within tolerance of the target are scored
+        lo = target_market_cap * (1 - tolerance)
+        hi = target_market_cap * (1 + tolerance)
+
         best_match: TokenInfo | None = None
         best_diff = float("inf")
 
+        # A plain loop on purpose: candidates are capped by the DexScreener
+        # search (MAX_SEARCH_RESULTS), and at that size building a NumPy
+        # array costs more than the whole scan.
         for token in candidates:
-            # Use market_cap if available, otherwise fdv
-            mcap = token.market_cap or token.fdv
-            if mcap <= 0:
+            mcap = token.effective_mcap
+            if mcap <= 0 or not lo <= mcap <= hi:
                 continue
 
-            diff = abs(mcap - target_market_cap) / target_market_cap
+            diff = abs(mcap - target_market_cap)
 
             if diff < best_diff:
                 best_diff = diff
                 best_match = token
 
-        # Only return if within tolerance
-        if best_match and best_diff <= tolerance:
-            return best_match
+                # Candidates are most liquid first, so a close match wins outright
+                if diff <= target_market_cap * self.CLOSE_MCAP_MATCH:
+                    break
 
         # If no good market cap match, return highest liquidity
-        return candidates[0] if candidates else None
+        return best_match or candidates[0]
 
-    def resolve(
+    async def resolve(
         self,
         ticker: str,
         market_cap_hint: float | None = None,
@@ -148,7 +257,10 @@ class TokenResolver:
         Returns:
             TokenInfo for the best match, or None
         """
-        candidates = self.search_by_ticker(ticker)
+        # Only the most liquid token is needed without a hint to disambiguate
+        candidates = await self.search_by_ticker(
+            ticker, limit=None if market_cap_hint else 1
+        )
 
         if not candidates:
             return None
@@ -161,16 +273,69 @@ class TokenResolver:
             # Default to highest liquidity
             token = candidates[0]
 
-        if token:
-            # Fetch supply
-            try:
-                supply = self.rpc_client.get_token_supply_ui(token.mint_address)
+        # Tokens served from the cache may already carry their supply
+        if token and not token.supply:
+            supply = await self._fetch_supply(token.mint_address)
+            if supply is not None:
                 token.supply = supply
-            except Exception:
-                pass
 
         return token
 
-    def close(self) -> None:
+    async def resolve_many(self, tickers: list[str]) -> list[TokenInfo | None]:
+        """
+        Resolve several ticker symbols concurrently.
+
+        Each distinct ticker (case-insensitive) is resolved once, up to
+        MAX_CONCURRENCY at a time over the clients' shared connection
+        pools.
+
+        Args:
+            tickers: Token ticker symbols
+
+        Returns:
+            TokenInfo (or None) for each ticker, in input order
+        """
+        keys = [t.upper() for t in tickers]
+        unique = list(dict.fromkeys(keys))
+        resolved = await gather_limited(
+            [self.resolve(t) for t in unique], self.MAX_CONCURRENCY
+        )
+        by_ticker = dict(zip(unique, resolved))
+        return [by_ticker[key] for key in keys]
+
+    async def _fetch_pair(self, mint_address: str) -> dict[str, Any] | None:
+        """Most liquid pair for a mint, from the disk cache or DexScreener."""
+        if self.disk_cache:
+            pair_data = self.disk_cache.get_pair(mint_address)
+            if pair_data is not None:
+                return pair_data
+
+        pair_data = await self.dex_client.get_token_by_address(mint_address)
+        if pair_data and self.disk_cache:
+            self.disk_cache.put_pair(mint_address, pair_data)
+        return pair_data
+
+    async def _fetch_supply(self, mint_address: str) -> float | None:
+        """UI token supply from the disk cache or RPC, or None if the lookup fails."""
+        if self.disk_cache:
+            supply = self.disk_cache.get_supply(mint_address)
+            if supply is not None:
+                return supply
+
+        try:
+            supply = await self.rpc_client.get_token_supply_ui(mint_address)
+        except Exception:
+            return None
+        if supply and self.disk_cache:
+            self.disk_cache.put_supply(mint_address, supply)
+        return supply
+
+    async def close(self) -> None:
         """Clean up resources."""
-        self.dex_client.close()
+        self._ticker_cache.clear()
+        self._mint_cache.clear()
+        if self._disk_cache:
+            self._disk_cache.close()
+            self._disk_cache = None
+        await self.dex_client.close()
+        await self.rpc_client.close()